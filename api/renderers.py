@@ -0,0 +1,35 @@
+"""
+DocuForge API Renderers
+
+JSON rendering via orjson when available. orjson is a C extension that
+serializes several times faster than stdlib json, which matters for
+render responses carrying large document bodies and for document lists
+with big context_data blobs. Falls back to DRF's stock JSONRenderer
+when orjson is not installed.
+"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+if orjson is not None:
+
+    class ORJSONRenderer(BaseRenderer):
+        """Render response data to JSON bytes with orjson."""
+
+        media_type = 'application/json'
+        format = 'json'
+        charset = None
+
+        def render(self, data, accepted_media_type=None, renderer_context=None):
+            if data is None:
+                return b''
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+
+    class ORJSONRenderer(JSONRenderer):
+        """Fallback when orjson is unavailable: stdlib JSON rendering."""
+        pass
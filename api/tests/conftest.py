@@ -0,0 +1,10 @@
+"""
+Test configuration for the API test suite.
+
+The project-root conftest stubs out django_db_setup because the parser
+suites need no database. The endpoint tests here do persist documents,
+so restore pytest-django's real fixture for this package only: it
+creates a migrated test database instead of pointing at the unmigrated
+development one.
+"""
+from pytest_django.fixtures import django_db_setup  # noqa: F401
@@ -7,6 +7,8 @@ from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from core.models import Document
+
 
 class TestHealthCheck(TestCase):
     """Tests for health check endpoint."""
@@ -75,6 +77,135 @@ class TestRenderEndpoint(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['content'], 'Visible')
 
+    def test_render_save_accepts_string_boolean(self):
+        """save arrives as a string from form posts; it must coerce."""
+        response = self.client.post('/api/render/', {
+            'template': 'Hello {{name}}!',
+            'context': {'name': 'World'},
+            'save': 'true',
+            'title': 'Greeting',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data['document_id'])
+
+    def test_render_save_rejects_non_boolean(self):
+        """Values outside the boolean coercion set still fail."""
+        response = self.client.post('/api/render/', {
+            'template': 'Hello {{name}}!',
+            'context': {'name': 'World'},
+            'save': 'maybe',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('save', response.data)
+
+
+class TestStreamRenderEndpoint(TestCase):
+    """Tests for streaming template render endpoint."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_stream_renders_variables_and_conditionals(self):
+        """The streamed body matches the rendered template."""
+        response = self.client.post('/api/render/stream/', {
+            'template': 'Hello {{name}}!{% if vip %} Welcome back.{% endif %}',
+            'context': {'name': 'John', 'vip': True}
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        body = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual(body, 'Hello John! Welcome back.')
+
+    def test_stream_output_is_not_stripped(self):
+        """Unlike render(), streamed output keeps surrounding whitespace."""
+        response = self.client.post('/api/render/stream/', {
+            'template': '  {{name}}  ',
+            'context': {'name': 'John'}
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual(body, '  John  ')
+
+    def test_stream_missing_stored_template_returns_404(self):
+        """An unknown template_id returns 404 before streaming starts."""
+        response = self.client.post('/api/render/stream/', {
+            'template_id': 999999,
+            'context': {}
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestBulkRenderEndpoint(TestCase):
+    """Tests for bulk template render endpoint."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_bulk_renders_all_items(self):
+        """Each item renders with its own context, in order."""
+        response = self.client.post('/api/render/bulk/', {
+            'items': [
+                {'template': 'Hello {{name}}!', 'context': {'name': 'John'}},
+                {'template': 'Bye {{name}}!', 'context': {'name': 'Jane'}},
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]['content'], 'Hello John!')
+        self.assertEqual(results[1]['content'], 'Bye Jane!')
+
+    def test_bulk_mixed_valid_and_invalid_preserves_order(self):
+        """Invalid items report errors in place; valid ones still render."""
+        response = self.client.post('/api/render/bulk/', {
+            'items': [
+                {'template': 'A {{x}}', 'context': {'x': 1}},
+                {'template': 'B {{x}}'},  # missing context
+                {'template': 'C {{x}}', 'context': {'x': 3}},
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['content'], 'A 1')
+        self.assertIn('context', results[1]['errors'])
+        self.assertEqual(results[2]['content'], 'C 3')
+
+    def test_bulk_saved_items_receive_document_ids(self):
+        """Items with save=true get distinct ids back-filled by index."""
+        response = self.client.post('/api/render/bulk/', {
+            'items': [
+                {'template': 'One {{x}}', 'context': {'x': 1},
+                 'save': True, 'title': 'First'},
+                {'template': 'Two {{x}}', 'context': {'x': 2}},
+                {'template': 'Three {{x}}', 'context': {'x': 3},
+                 'save': True, 'title': 'Third'},
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertIsNotNone(results[0]['document_id'])
+        self.assertIsNone(results[1]['document_id'])
+        self.assertIsNotNone(results[2]['document_id'])
+        self.assertNotEqual(results[0]['document_id'], results[2]['document_id'])
+        saved = Document.objects.get(id=results[2]['document_id'])
+        self.assertEqual(saved.title, 'Third')
+        self.assertEqual(saved.content, 'Three 3')
+
+    def test_bulk_rejects_non_list_items(self):
+        """A non-list items body returns 400."""
+        response = self.client.post('/api/render/bulk/', {
+            'items': {'template': 'Hello', 'context': {}}
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_rejects_empty_items(self):
+        """An empty items list returns 400."""
+        response = self.client.post('/api/render/bulk/', {
+            'items': []
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class TestValidateEndpoint(TestCase):
     """Tests for template validation endpoint."""
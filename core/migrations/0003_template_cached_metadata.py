@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_performance_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='template',
+            name='cached_variables',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='template',
+            name='cached_conditions',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
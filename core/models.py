@@ -30,12 +30,29 @@ class Template(models.Model):
     # Optional tenant association
     tenant_id = models.CharField(max_length=100, blank=True, null=True, db_index=True)
 
+    # Parse metadata, denormalized from `content` on save so readers
+    # never need to re-tokenize the template to know what it uses.
+    cached_variables = models.JSONField(default=list, blank=True)
+    cached_conditions = models.JSONField(default=list, blank=True)
+
     class Meta:
         ordering = ['-updated_at']
         indexes = [
             models.Index(fields=['slug', 'tenant_id']),
+            models.Index(
+                fields=['tenant_id', 'is_active'],
+                name='tmpl_tenant_active_idx',
+            ),
+            models.Index(fields=['is_active']),
         ]
 
+    def save(self, *args, **kwargs):
+        from core.parser import compile_template
+        compiled = compile_template(self.content)
+        self.cached_variables = compiled.variables
+        self.cached_conditions = compiled.conditions
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name} (v{self.version})"
 
@@ -64,6 +81,9 @@ class Document(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['tenant_id', '-created_at']),
+        ]
 
     def __str__(self):
         return self.title
@@ -1,5 +1,12 @@
-from .template_engine import TemplateEngine
-from .condition_evaluator import ConditionEvaluator
+from .template_engine import (
+    TemplateEngine,
+    CompiledTemplate,
+    RenderResult,
+    compile_template,
+    DEFAULT_ENGINE,
+    render,
+)
+from .condition_evaluator import ConditionEvaluator, DEFAULT_EVALUATOR, evaluate
 from .variable_resolver import VariableResolver
 from .exceptions import (
     TemplateEngineError,
@@ -11,7 +18,14 @@ from .exceptions import (
 
 __all__ = [
     'TemplateEngine',
+    'CompiledTemplate',
+    'RenderResult',
+    'compile_template',
+    'DEFAULT_ENGINE',
+    'render',
     'ConditionEvaluator',
+    'DEFAULT_EVALUATOR',
+    'evaluate',
     'VariableResolver',
     'TemplateEngineError',
     'VariableResolutionError',
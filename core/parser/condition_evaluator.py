@@ -21,6 +21,8 @@ Examples:
 
 Author: Ahmed Sallemi | MediaTree
 """
+import functools
+import itertools
 import re
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass
@@ -58,6 +60,40 @@ class Token:
     position: int = 0
 
 
+# Master token pattern: one alternation matched left-to-right by the C
+# regex engine replaces the old character-at-a-time lexer loop. The
+# branches are disjoint by leading character, so they are ordered by
+# empirical frequency (identifiers and the whitespace between tokens
+# dominate real conditions); two-char operators still precede their
+# one-char prefixes within the OP branch.
+_TOKEN_RE = re.compile(
+    r'(?P<ID>[A-Za-z_][\w.]*)'
+    r'|(?P<WS>\s+)'
+    r'|(?P<OP>==|!=|<=|>=|[<>()])'
+    r'|(?P<NUM>\d+(?:\.\d+)?)'
+    r'|(?P<STR>"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')'
+)
+
+_OP_TOKENS = {
+    '==': TokenType.EQ,
+    '!=': TokenType.NEQ,
+    '<=': TokenType.LTE,
+    '>=': TokenType.GTE,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+}
+
+# Backslash escapes inside string literals: \x -> x
+_ESCAPE_RE = re.compile(r'\\(.)')
+
+# First characters of the keyword set (both cases). Most identifiers are
+# variable paths like user.profile.name; this gate skips the keyword
+# dict probe for anything that cannot be a keyword.
+_KW_FIRST_CHARS = frozenset('aAoOnNtTfF')
+
+
 class ConditionLexer:
     """Tokenizes condition strings."""
 
@@ -73,142 +109,359 @@ class ConditionLexer:
 
     def __init__(self, text: str):
         self.text = text
-        self.pos = 0
-        self.current_char = text[0] if text else None
 
-    def advance(self):
-        """Move to next character."""
-        self.pos += 1
-        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
-
-    def skip_whitespace(self):
-        """Skip whitespace characters."""
-        while self.current_char and self.current_char.isspace():
-            self.advance()
-
-    def read_number(self) -> Token:
-        """Read a numeric literal."""
-        result = ''
-        start_pos = self.pos
-        has_dot = False
-
-        while self.current_char and (self.current_char.isdigit() or self.current_char == '.'):
-            if self.current_char == '.':
-                if has_dot:
-                    break
-                has_dot = True
-            result += self.current_char
-            self.advance()
-
-        value = float(result) if has_dot else int(result)
-        return Token(TokenType.NUMBER, value, start_pos)
-
-    def read_string(self, quote_char: str) -> Token:
-        """Read a string literal."""
-        start_pos = self.pos
-        self.advance()  # Skip opening quote
-        result = ''
-
-        while self.current_char and self.current_char != quote_char:
-            if self.current_char == '\\' and self.pos + 1 < len(self.text):
-                self.advance()
-                result += self.current_char
-            else:
-                result += self.current_char
-            self.advance()
-
-        self.advance()  # Skip closing quote
-        return Token(TokenType.STRING, result, start_pos)
-
-    def read_identifier(self) -> Token:
-        """Read an identifier or keyword."""
-        start_pos = self.pos
-        result = ''
-
-        while self.current_char and (self.current_char.isalnum() or self.current_char in '_.'):
-            result += self.current_char
-            self.advance()
-
-        lower = result.lower()
-        if lower in self.KEYWORDS:
-            token_type = self.KEYWORDS[lower]
-            if token_type == TokenType.BOOLEAN:
-                return Token(token_type, lower == 'true', start_pos)
-            return Token(token_type, result, start_pos)
-
-        return Token(TokenType.VARIABLE, result, start_pos)
-
-    def get_next_token(self) -> Token:
-        """Get the next token from input."""
-        while self.current_char:
-            # Skip whitespace
-            if self.current_char.isspace():
-                self.skip_whitespace()
+    # Every case variant of every keyword, mapped to (token type,
+    # canonical lowercase form). Keywords are short, so the full
+    # expansion is only ~100 entries; matching the raw token against it
+    # replaces the per-token .lower() call, making case-insensitivity a
+    # single allocation-free dict probe.
+    _KEYWORD_VARIANTS = {
+        variant: (token_type, word)
+        for word, token_type in KEYWORDS.items()
+        for variant in map(
+            ''.join, itertools.product(*zip(word.lower(), word.upper()))
+        )
+    }
+
+    def tokenize(self) -> List[Token]:
+        """Tokenize the entire input in one regex pass."""
+        text = self.text
+        tokens: List[Token] = []
+        append = tokens.append
+        pos = 0
+
+        for match in _TOKEN_RE.finditer(text):
+            if match.start() != pos:
+                raise ConditionEvaluationError(
+                    text,
+                    f"Unexpected character '{text[pos]}' at position {pos}"
+                )
+            pos = match.end()
+
+            group = match.lastgroup
+            if group == 'WS':
                 continue
 
-            # Numbers
-            if self.current_char.isdigit():
-                return self.read_number()
-
-            # Strings
-            if self.current_char in '"\'':
-                return self.read_string(self.current_char)
-
-            # Identifiers and keywords
-            if self.current_char.isalpha() or self.current_char == '_':
-                return self.read_identifier()
-
-            # Two-character operators
-            if self.pos + 1 < len(self.text):
-                two_char = self.text[self.pos:self.pos + 2]
-                if two_char == '==':
-                    self.advance()
-                    self.advance()
-                    return Token(TokenType.EQ, '==', self.pos - 2)
-                if two_char == '!=':
-                    self.advance()
-                    self.advance()
-                    return Token(TokenType.NEQ, '!=', self.pos - 2)
-                if two_char == '<=':
-                    self.advance()
-                    self.advance()
-                    return Token(TokenType.LTE, '<=', self.pos - 2)
-                if two_char == '>=':
-                    self.advance()
-                    self.advance()
-                    return Token(TokenType.GTE, '>=', self.pos - 2)
-
-            # Single-character operators
-            pos = self.pos
-            if self.current_char == '<':
-                self.advance()
-                return Token(TokenType.LT, '<', pos)
-            if self.current_char == '>':
-                self.advance()
-                return Token(TokenType.GT, '>', pos)
-            if self.current_char == '(':
-                self.advance()
-                return Token(TokenType.LPAREN, '(', pos)
-            if self.current_char == ')':
-                self.advance()
-                return Token(TokenType.RPAREN, ')', pos)
+            value = match.group()
+            if group == 'NUM':
+                append(Token(
+                    TokenType.NUMBER,
+                    float(value) if '.' in value else int(value),
+                    match.start(),
+                ))
+            elif group == 'STR':
+                append(Token(
+                    TokenType.STRING,
+                    _ESCAPE_RE.sub(r'\1', value[1:-1]),
+                    match.start(),
+                ))
+            elif group == 'ID':
+                keyword = None
+                if value[0] in _KW_FIRST_CHARS:
+                    keyword = self._KEYWORD_VARIANTS.get(value)
+                if keyword is None:
+                    append(Token(TokenType.VARIABLE, value, match.start()))
+                elif keyword[0] is TokenType.BOOLEAN:
+                    append(Token(keyword[0], keyword[1] == 'true', match.start()))
+                else:
+                    append(Token(keyword[0], value, match.start()))
+            else:  # OP
+                append(Token(_OP_TOKENS[value], value, match.start()))
+
+        if pos != len(text):
+            raise ConditionEvaluationError(
+                text,
+                f"Unexpected character '{text[pos]}' at position {pos}"
+            )
+
+        append(Token(TokenType.EOF, None, pos))
+        return tokens
 
+
+# Source fragments for the comparison operators, which are spelled
+# identically in Python.
+_COMPARISON_OPS = {
+    TokenType.EQ: '==',
+    TokenType.NEQ: '!=',
+    TokenType.LT: '<',
+    TokenType.LTE: '<=',
+    TokenType.GT: '>',
+    TokenType.GTE: '>=',
+}
+
+
+class _ConditionTranslator:
+    """
+    Recursive-descent translator from a token list to Python source.
+
+    Implements exactly the grammar of the original tree-walking parser:
+
+        or_expr    = and_expr (OR and_expr)*
+        and_expr   = not_expr (AND not_expr)*
+        not_expr   = NOT not_expr | comparison
+        comparison = primary (comp_op primary)?
+        primary    = LPAREN or_expr RPAREN | literal | variable
+
+    Enforcing the grammar before compile() is what makes the codegen
+    safe: comparison operands are primaries (so `a == b == c` never
+    becomes a Python chained comparison), juxtaposed atoms like `f (y)`
+    are rejected instead of compiling to a call, and parentheses must
+    balance. The emitted source can therefore only ever contain
+    literals, and/or/not, single comparisons and resolver calls.
+    """
+
+    def __init__(self, condition: str, tokens: List[Token], counts: Dict[str, int]):
+        self.condition = condition
+        self.tokens = tokens
+        self.counts = counts
+        self.pos = 0
+
+    def translate(self) -> str:
+        """Parse the full token list and return the Python source."""
+        source = self._parse_or()
+        token = self.tokens[self.pos]
+        if token.type is not TokenType.EOF:
             raise ConditionEvaluationError(
-                self.text,
-                f"Unexpected character '{self.current_char}' at position {self.pos}"
+                self.condition,
+                f"Unexpected token: {token.value}"
             )
+        return source
+
+    def _parse_or(self) -> str:
+        parts = [self._parse_and()]
+        while self.tokens[self.pos].type is TokenType.OR:
+            self.pos += 1
+            parts.append(self._parse_and())
+        return ' or '.join(parts)
+
+    def _parse_and(self) -> str:
+        parts = [self._parse_not()]
+        while self.tokens[self.pos].type is TokenType.AND:
+            self.pos += 1
+            parts.append(self._parse_not())
+        return ' and '.join(parts)
+
+    def _parse_not(self) -> str:
+        # Fold NOT chains by parity: `NOT NOT x` is truthiness-
+        # equivalent to `x` everywhere a not_expr result is used
+        # (boolean operands and the final bool()), so only an odd run
+        # emits a `not`.
+        not_run = 0
+        while self.tokens[self.pos].type is TokenType.NOT:
+            not_run += 1
+            self.pos += 1
+        source = self._parse_comparison()
+        if not_run & 1:
+            return 'not ' + source
+        return source
+
+    def _parse_comparison(self) -> str:
+        left, left_is_group = self._parse_primary()
+        op = _COMPARISON_OPS.get(self.tokens[self.pos].type)
+        if op is None:
+            return left
+        self.pos += 1
+        right, right_is_group = self._parse_primary()
+        # In the original evaluator a parenthesized group always passed
+        # back through the or/and/comparison chain, which coerced it to
+        # bool - so '(a AND b) == true' compared a bool, not Python's
+        # `a and b` (which yields an operand). Wrap group operands in
+        # bool() to keep that semantics; `_b` is the real bool builtin
+        # injected alongside the resolvers.
+        if left_is_group:
+            left = '_b' + left
+        if right_is_group:
+            right = '_b' + right
+        return f'{left} {op} {right}'
+
+    def _parse_primary(self):
+        """Parse one primary; returns (source, is_parenthesized_group)."""
+        token = self.tokens[self.pos]
+        token_type = token.type
+        self.pos += 1
 
-        return Token(TokenType.EOF, None, self.pos)
+        if token_type is TokenType.VARIABLE:
+            # Paths are split once here, so the per-evaluation resolver
+            # walks a ready-made tuple instead of re-splitting the
+            # string on every lookup.
+            path = tuple(token.value.split('.'))
+            if self.counts[token.value] > 1:
+                return f'_vm({path!r}, _c, _m)', False
+            return f'_v({path!r}, _c)', False
+        if token_type in (TokenType.NUMBER, TokenType.STRING):
+            return repr(token.value), False
+        if token_type is TokenType.BOOLEAN:
+            return ('True' if token.value else 'False'), False
+        if token_type is TokenType.NULL:
+            return 'None', False
+        if token_type is TokenType.LPAREN:
+            inner = self._parse_or()
+            if self.tokens[self.pos].type is not TokenType.RPAREN:
+                raise ConditionEvaluationError(
+                    self.condition,
+                    "Missing closing parenthesis"
+                )
+            self.pos += 1
+            return f'({inner})', True
 
-    def tokenize(self) -> List[Token]:
-        """Tokenize the entire input."""
-        tokens = []
-        while True:
-            token = self.get_next_token()
-            tokens.append(token)
-            if token.type == TokenType.EOF:
-                break
-        return tokens
+        raise ConditionEvaluationError(
+            self.condition,
+            f"Unexpected token: {token.value}"
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_condition(condition: str):
+    """
+    Translate a condition string into a Python code object, once.
+
+    The token list is run through _ConditionTranslator - the original
+    recursive-descent grammar - which emits Python expression source
+    (AND/OR/NOT -> and/or/not, identical comparison operators and
+    precedence) for CPython's compiler to turn into bytecode. Repeat
+    evaluations of the same condition then skip tokenization and
+    parsing entirely - they run a single cached code object. Anything
+    outside the grammar raises ConditionEvaluationError before any
+    source is compiled.
+
+    Variable paths referenced more than once compile to the memoizing
+    resolver `_vm(name, _c, _m)`, so each atom resolves at most once per
+    evaluation regardless of how often it appears. Single-use paths keep
+    the plain `_v(name, _c)` call - no memo dict, no overhead. Returns
+    `(code, uses_memo)` so callers know whether to supply the memo.
+
+    Only literals, operators and resolver lookups can appear in the
+    generated source; no builtins are exposed at eval time.
+    """
+    tokens = ConditionLexer(condition).tokenize()
+
+    counts: Dict[str, int] = {}
+    for token in tokens:
+        if token.type == TokenType.VARIABLE:
+            counts[token.value] = counts.get(token.value, 0) + 1
+    uses_memo = any(count > 1 for count in counts.values())
+
+    source = _ConditionTranslator(condition, tokens, counts).translate()
+
+    try:
+        return compile(source, '<condition>', 'eval'), uses_memo
+    except SyntaxError as e:
+        raise ConditionEvaluationError(condition, str(e))
+
+
+@functools.lru_cache(maxsize=1024)
+def fold_constant(condition: str) -> Optional[bool]:
+    """
+    Evaluate a condition at compile time when it references no variables.
+
+    Conditions over literals only ("true", "1 > 2", "NOT false") have
+    one answer forever, so template compilation can resolve the branch
+    once instead of re-evaluating per render. Returns None for anything
+    involving a variable or that fails to lex/evaluate - those keep
+    their runtime semantics untouched.
+    """
+    if not condition or condition.isspace():
+        return True
+    try:
+        tokens = ConditionLexer(condition).tokenize()
+    except ConditionEvaluationError:
+        return None
+    if any(token.type is TokenType.VARIABLE for token in tokens):
+        return None
+    try:
+        code, _ = _compile_condition(condition)
+        return bool(eval(code, _EVAL_GLOBALS, {'_c': {}}))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def strip_outer_not(condition: str) -> Optional[str]:
+    """
+    Return the operand of a whole-condition NOT, or None.
+
+    Recognizes "NOT atom" and "NOT ( ... )" where the negation covers
+    the entire expression - precisely the cases where a conditional
+    block can swap its then/else branches at compile time and test the
+    un-negated condition, dropping the runtime `not`. "NOT a AND b"
+    negates only `a`, so it (and every other shape) returns None.
+    """
+    try:
+        tokens = ConditionLexer(condition).tokenize()
+    except ConditionEvaluationError:
+        return None
+    if len(tokens) < 3 or tokens[0].type is not TokenType.NOT:
+        return None
+
+    rest = tokens[1:-1]  # drop leading NOT and trailing EOF
+    if len(rest) == 1:
+        if rest[0].type is not TokenType.VARIABLE:
+            return None
+    elif rest[0].type is TokenType.LPAREN:
+        # The parens must enclose the whole remainder: depth may only
+        # return to zero at the final token.
+        depth = 0
+        for i, token in enumerate(rest):
+            if token.type is TokenType.LPAREN:
+                depth += 1
+            elif token.type is TokenType.RPAREN:
+                depth -= 1
+                if depth == 0 and i != len(rest) - 1:
+                    return None
+        if depth != 0:
+            return None
+    else:
+        return None
+
+    return condition[rest[0].position:]
+
+
+def _resolve_parts(parts: tuple, context: Dict[str, Any]) -> Any:
+    """Walk a pre-split variable path through the context."""
+    value = context
+
+    for part in parts:
+        if isinstance(value, dict):
+            if part not in value:
+                return None  # Missing keys resolve to None
+            value = value[part]
+        elif hasattr(value, part):
+            value = getattr(value, part)
+        else:
+            return None
+
+    return value
+
+
+def _resolve_variable(name: str, context: Dict[str, Any]) -> Any:
+    """
+    Resolve a variable name to its value from context.
+
+    Supports dot notation for nested access: "user.profile.name"
+    """
+    return _resolve_parts(tuple(name.split('.')), context)
+
+
+def _resolve_memoized(parts: tuple, context: Dict[str, Any], memo: Dict[str, Any]) -> Any:
+    """Resolve a pre-split path, caching the value for this evaluation."""
+    if parts in memo:
+        return memo[parts]
+    value = _resolve_parts(parts, context)
+    memo[parts] = value
+    return value
+
+
+# Shared globals for every compiled condition: the resolvers are module
+# functions taking the context explicitly, so evaluate() never builds a
+# per-call closure.
+_EVAL_GLOBALS = {
+    '__builtins__': {},
+    '_v': _resolve_parts,
+    '_vm': _resolve_memoized,
+    # bool, for coercing parenthesized groups used as comparison
+    # operands (see _ConditionTranslator._parse_comparison).
+    '_b': bool,
+}
 
 
 class ConditionEvaluator:
@@ -234,13 +487,13 @@ class ConditionEvaluator:
         With A=False, B=True, C=True:
         WRONG: False AND (True OR True) = False AND True = False
         RIGHT: (False AND True) OR True = False OR True = True
-    """
 
-    def __init__(self):
-        self.tokens: List[Token] = []
-        self.pos: int = 0
-        self.current_token: Optional[Token] = None
-        self.context: Dict[str, Any] = {}
+    Conditions are compiled to Python bytecode (cached per condition
+    string), which preserves this precedence because the template
+    operators map one-to-one onto Python's own. The mapping also gives
+    true short-circuit semantics for free: a decided AND/OR chain never
+    resolves or compares its remaining operands.
+    """
 
     def evaluate(self, condition: str, context: Dict[str, Any]) -> bool:
         """
@@ -256,172 +509,79 @@ class ConditionEvaluator:
         Raises:
             ConditionEvaluationError: If the condition is invalid
         """
-        if not condition or not condition.strip():
+        if not condition or condition.isspace():
             return True  # Empty condition is always true
 
-        self.context = context
-        lexer = ConditionLexer(condition.strip())
-        self.tokens = lexer.tokenize()
-        self.pos = 0
-        self.current_token = self.tokens[0]
+        # Keyed on the raw string so repeat evaluations are a single
+        # cache probe with no per-call strip() allocation; the lexer
+        # ignores surrounding whitespace anyway.
+        code, uses_memo = _compile_condition(condition)
 
         try:
-            result = self._parse_or()
-
-            if self.current_token.type != TokenType.EOF:
-                raise ConditionEvaluationError(
-                    condition,
-                    f"Unexpected token: {self.current_token.value}"
-                )
-
-            return bool(result)
+            if uses_memo:
+                return bool(eval(code, _EVAL_GLOBALS, {'_c': context, '_m': {}}))
+            return bool(eval(code, _EVAL_GLOBALS, {'_c': context}))
+        except ConditionEvaluationError:
+            raise
         except Exception as e:
-            if isinstance(e, ConditionEvaluationError):
-                raise
             raise ConditionEvaluationError(condition, str(e))
 
-    def _advance(self):
-        """Move to the next token."""
-        self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-
-    def _parse_or(self) -> bool:
-        """
-        Parse OR expressions (lowest precedence).
-
-        Grammar: or_expr = and_expr (OR and_expr)*
-        """
-        result = self._parse_and()
-
-        while self.current_token.type == TokenType.OR:
-            self._advance()
-            right = self._parse_and()
-            result = result or right
-
-        return result
-
-    def _parse_and(self) -> bool:
+    def evaluate_batch(
+        self, condition: str, contexts: List[Dict[str, Any]]
+    ) -> List[bool]:
         """
-        Parse AND expressions (higher precedence than OR).
+        Evaluate one condition against many contexts.
 
-        Grammar: and_expr = not_expr (AND not_expr)*
-        """
-        result = self._parse_not()
+        Compiles (or cache-probes) the condition exactly once and runs
+        the code object in a tight loop, so per-row cost is a single
+        eval of cached bytecode - the path bulk document generation
+        should use instead of calling evaluate() per row.
 
-        while self.current_token.type == TokenType.AND:
-            self._advance()
-            right = self._parse_not()
-            result = result and right
-
-        return result
+        Args:
+            condition: The condition string to evaluate
+            contexts: List of variable-value dictionaries
 
-    def _parse_not(self) -> bool:
-        """
-        Parse NOT expressions (higher precedence than AND).
+        Returns:
+            List of boolean results, one per context, in order
 
-        Grammar: not_expr = NOT not_expr | comparison
+        Raises:
+            ConditionEvaluationError: If the condition is invalid
         """
-        if self.current_token.type == TokenType.NOT:
-            self._advance()
-            return not self._parse_not()
+        if not condition or condition.isspace():
+            return [True] * len(contexts)
 
-        return self._parse_comparison()
+        code, uses_memo = _compile_condition(condition)
 
-    def _parse_comparison(self) -> bool:
-        """
-        Parse comparison expressions.
+        try:
+            if uses_memo:
+                return [
+                    bool(eval(code, _EVAL_GLOBALS, {'_c': context, '_m': {}}))
+                    for context in contexts
+                ]
+            return [
+                bool(eval(code, _EVAL_GLOBALS, {'_c': context}))
+                for context in contexts
+            ]
+        except ConditionEvaluationError:
+            raise
+        except Exception as e:
+            raise ConditionEvaluationError(condition, str(e))
 
-        Grammar: comparison = primary (comp_op primary)?
-        """
-        left = self._parse_primary()
-
-        if self.current_token.type in (
-            TokenType.EQ, TokenType.NEQ,
-            TokenType.LT, TokenType.LTE,
-            TokenType.GT, TokenType.GTE
-        ):
-            op = self.current_token.type
-            self._advance()
-            right = self._parse_primary()
-
-            if op == TokenType.EQ:
-                return left == right
-            elif op == TokenType.NEQ:
-                return left != right
-            elif op == TokenType.LT:
-                return left < right
-            elif op == TokenType.LTE:
-                return left <= right
-            elif op == TokenType.GT:
-                return left > right
-            elif op == TokenType.GTE:
-                return left >= right
-
-        # If no comparison, treat as boolean
-        return bool(left)
-
-    def _parse_primary(self) -> Any:
+    def _resolve_variable(self, name: str, context: Dict[str, Any]) -> Any:
         """
-        Parse primary expressions (highest precedence).
+        Resolve a variable name to its value from context.
 
-        Grammar: primary = LPAREN or_expr RPAREN | literal | variable
+        Supports dot notation for nested access: "user.profile.name"
         """
-        token = self.current_token
-
-        if token.type == TokenType.LPAREN:
-            self._advance()
-            result = self._parse_or()
-            if self.current_token.type != TokenType.RPAREN:
-                raise ConditionEvaluationError(
-                    "",
-                    "Missing closing parenthesis"
-                )
-            self._advance()
-            return result
-
-        if token.type == TokenType.NUMBER:
-            self._advance()
-            return token.value
-
-        if token.type == TokenType.STRING:
-            self._advance()
-            return token.value
-
-        if token.type == TokenType.BOOLEAN:
-            self._advance()
-            return token.value
+        return _resolve_variable(name, context)
 
-        if token.type == TokenType.NULL:
-            self._advance()
-            return None
-
-        if token.type == TokenType.VARIABLE:
-            self._advance()
-            return self._resolve_variable(token.value)
 
-        raise ConditionEvaluationError(
-            "",
-            f"Unexpected token: {token.value}"
-        )
+# Shared default evaluator. The class carries no instance state (the
+# compiled-condition cache is module-level), so one instance serves
+# every caller.
+DEFAULT_EVALUATOR = ConditionEvaluator()
 
-    def _resolve_variable(self, name: str) -> Any:
-        """
-        Resolve a variable name to its value from context.
 
-        Supports dot notation for nested access: "user.profile.name"
-        """
-        parts = name.split('.')
-        value = self.context
-
-        for part in parts:
-            if isinstance(value, dict):
-                if part not in value:
-                    return None  # Missing keys resolve to None
-                value = value[part]
-            elif hasattr(value, part):
-                value = getattr(value, part)
-            else:
-                return None
-
-        return value
+def evaluate(condition: str, context: Dict[str, Any]) -> bool:
+    """Evaluate a condition through the shared default evaluator."""
+    return DEFAULT_EVALUATOR.evaluate(condition, context)
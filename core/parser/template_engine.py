@@ -18,30 +18,142 @@ Syntax:
 
 Author: Ahmed Sallemi | MediaTree
 """
+import functools
 import re
-from typing import Any, Dict, List, Optional, Set, Union
+import sys
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Union
 from dataclasses import dataclass
 
+try:
+    # Optional: google-re2 compiles to a linear-time DFA, removing any
+    # backtracking risk on adversarial templates. The patterns used
+    # here are backreference-free, so both engines behave identically.
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 from .exceptions import (
     InvalidTemplateError,
     VariableResolutionError,
     CircularDependencyError,
 )
-from .condition_evaluator import ConditionEvaluator
-from .variable_resolver import VariableResolver
+from .condition_evaluator import ConditionEvaluator, fold_constant, strip_outer_not
+from .variable_resolver import VariableResolver, _MISSING
+
+
+# Single combined pattern used by the one-pass tokenizer. Matches either
+# a variable tag ({{name}}, group 1) or a block tag ({% keyword payload %},
+# groups 2 and 3). Scanning once with this pattern replaces the separate
+# section/conditional/include/variable regex passes.
+TAG_PATTERN = _regex.compile(
+    r'\{\{(\w+(?:\.\w+)*)\}\}'
+    r'|\{%\s*(if|else|endif|section|endsection|include)\b\s*([^%]*?)\s*%\}',
+    re.DOTALL
+)
 
 
-@dataclass
-class Section:
-    """Represents a named section within a template."""
-    name: str
+@functools.lru_cache(maxsize=4096, typed=True)
+def _safe_str_scalar(value: Union[str, int, float, bool]) -> str:
+    """
+    Format a scalar for output, memoized.
+
+    The same values (names, addresses, amounts) recur across documents
+    in a batch, so repeat formatting becomes a cache probe. `typed=True`
+    keeps True/1 and 1/1.0 as distinct entries, preserving the
+    bool -> Yes/No rendering.
+    """
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, str):
+        return value.strip()
+    return str(value)
+
+
+# Exact-type converter dispatch for the common scalar cases: one hash
+# lookup on type(value) replaces the sequential isinstance chain.
+# True/False are handled by identity before this table is consulted
+# (they are singletons, and a pointer compare beats the probe), so bool
+# needs no entry; exact-type keys mean int can't swallow bools anyway.
+# Subclasses and containers fall through to the isinstance-based path.
+_CONVERTERS = {
+    type(None): lambda v: "",
+    int: str,
+    float: str,
+    str: lambda v: _safe_str_scalar(v),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _missing_placeholder(var_name: str) -> str:
+    """
+    The rendered form of a missing variable, built once per name.
+
+    Bulk renders hit the same few missing keys thousands of times; this
+    turns each repeat f-string build into a cache probe returning the
+    same interned object. ("Yes"/"No"/"" need no such cache - they are
+    code-object constants already.)
+    """
+    return f"[{var_name}]"
+
+
+class RenderResult(NamedTuple):
+    """Rendered content plus template metadata, from one compile."""
     content: str
-    condition: Optional[str] = None
-    dependencies: List[str] = None
+    variables: List[str]
+    conditions: List[str]
+
+
+@dataclass
+class Program:
+    """
+    A template compiled to an executable op tree.
+
+    Ops are tuples:
+        ('lit', text)                          -- emit literal text
+        ('var', name)                          -- emit a resolved variable
+        ('if', condition, then_ops, else_ops)  -- conditional block
+        ('include', name)                      -- inline a named section
+
+    `variables` and `conditions` are collected during the single
+    tokenizer pass, so metadata extraction costs nothing extra.
+
+    `simple` marks programs that are pure literal/variable streams
+    (no conditionals, sections or includes), which execute() renders
+    through a stripped-down loop. When such a program can also be
+    expressed as a str.format field layout, `format_str` holds the
+    translated format string (dots in variable names become `__`) and
+    rendering collapses to a single C-level format_map call.
+    """
+    ops: List[tuple]
+    sections: Dict[str, List[tuple]]
+    variables: List[str]
+    conditions: List[str]
+    simple: bool = False
+    format_str: Optional[str] = None
+
+
+class _CtxMap(dict):
+    """
+    Lazy mapping bridging str.format_map to engine variable semantics.
 
-    def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
+    The dict itself stays empty so every field lookup routes through
+    __missing__, which applies the engine's resolution rules (strict
+    lookup, [placeholder] for missing, type-safe formatting) instead of
+    format()'s default str() conversion.
+    """
+
+    def __init__(self, engine: 'TemplateEngine', context: Dict[str, Any]):
+        super().__init__()
+        self._engine = engine
+        self._context = context
+
+    def __missing__(self, key: str) -> str:
+        value = self._engine._render_variable(
+            key.replace('__', '.'), self._context
+        )
+        # Store the rendered piece so repeated fields resolve once
+        self[key] = value
+        return value
 
 
 class TemplateEngine:
@@ -62,38 +174,33 @@ class TemplateEngine:
         # Result: "Hello John, your items: Apple, Orange, Banana"
     """
 
-    # Regex patterns for parsing
-    VARIABLE_PATTERN = re.compile(r'\{\{(\w+(?:\.\w+)*)\}\}')
-    CONDITIONAL_PATTERN = re.compile(
-        r'\{%\s*if\s+(.+?)\s*%\}(.*?)\{%\s*endif\s*%\}',
-        re.DOTALL
-    )
-    CONDITIONAL_ELSE_PATTERN = re.compile(
-        r'\{%\s*if\s+(.+?)\s*%\}(.*?)\{%\s*else\s*%\}(.*?)\{%\s*endif\s*%\}',
-        re.DOTALL
-    )
-    SECTION_PATTERN = re.compile(
-        r'\{%\s*section\s+(\w+)\s*%\}(.*?)\{%\s*endsection\s*%\}',
-        re.DOTALL
-    )
-    INCLUDE_PATTERN = re.compile(r'\{%\s*include\s+(\w+)\s*%\}')
-
     def __init__(self):
         self.condition_evaluator = ConditionEvaluator()
-        self.variable_resolver = VariableResolver()
-        self._sections: Dict[str, Section] = {}
-        self._resolution_stack: Set[str] = set()
-
-    def render(self, template: str, context: Dict[str, Any]) -> str:
+        # Strict resolution distinguishes a missing variable (rendered as
+        # a [placeholder]) from a present-but-None value (rendered empty).
+        self.variable_resolver = VariableResolver(strict=True)
+
+    def render(
+        self,
+        template: str,
+        context: Dict[str, Any],
+        *,
+        collect_meta: bool = False,
+    ) -> Union[str, RenderResult]:
         """
         Render a template with the given context.
 
         Args:
             template: The template string to render
             context: Dictionary of variables to substitute
+            collect_meta: If True, return a RenderResult carrying the
+                template's variables and conditions alongside the
+                content, so callers that need metadata don't re-scan
+                the template.
 
         Returns:
-            The rendered template string
+            The rendered template string, or a RenderResult when
+            collect_meta is True
 
         Raises:
             InvalidTemplateError: If template syntax is invalid
@@ -103,117 +210,330 @@ class TemplateEngine:
         if not isinstance(template, str):
             raise InvalidTemplateError(str(template), "Template must be a string")
 
-        # Reset state
-        self._sections = {}
-        self._resolution_stack = set()
-
-        # Parse sections first
-        template = self._parse_sections(template)
-
-        # Process conditionals (with else)
-        template = self._process_conditionals_with_else(template, context)
-
-        # Process conditionals (without else)
-        template = self._process_conditionals(template, context)
-
-        # Process includes
-        template = self._process_includes(template, context)
-
-        # Substitute variables
-        template = self._substitute_variables(template, context)
-
-        return template.strip()
-
-    def _parse_sections(self, template: str) -> str:
-        """Extract and store named sections from the template."""
-        def section_handler(match):
-            name = match.group(1)
-            content = match.group(2)
-            self._sections[name] = Section(name=name, content=content.strip())
-            return ""  # Remove section definition from main template
-
-        return self.SECTION_PATTERN.sub(section_handler, template)
-
-    def _process_conditionals_with_else(self, template: str, context: Dict[str, Any]) -> str:
-        """Process {% if %}...{% else %}...{% endif %} blocks."""
-        def conditional_handler(match):
-            condition = match.group(1)
-            true_content = match.group(2)
-            false_content = match.group(3)
-
-            try:
-                result = self.condition_evaluator.evaluate(condition, context)
-                return true_content if result else false_content
-            except Exception as e:
-                # Log but don't crash - return empty for failed conditions
-                return ""
-
-        return self.CONDITIONAL_ELSE_PATTERN.sub(conditional_handler, template)
-
-    def _process_conditionals(self, template: str, context: Dict[str, Any]) -> str:
-        """Process {% if %}...{% endif %} blocks."""
-        def conditional_handler(match):
-            condition = match.group(1)
-            content = match.group(2)
-
-            try:
-                result = self.condition_evaluator.evaluate(condition, context)
-                return content if result else ""
-            except Exception as e:
-                return ""
-
-        return self.CONDITIONAL_PATTERN.sub(conditional_handler, template)
-
-    def _process_includes(self, template: str, context: Dict[str, Any]) -> str:
-        """Process {% include section_name %} directives with cycle detection."""
-        def include_handler(match):
-            section_name = match.group(1)
-
-            # Circular dependency detection
-            if section_name in self._resolution_stack:
-                chain = list(self._resolution_stack) + [section_name]
-                raise CircularDependencyError(chain)
-
-            if section_name not in self._sections:
-                return f"[MISSING SECTION: {section_name}]"
+        # Share the module-level plan cache so repeated renders of the
+        # same template string skip compilation even through this
+        # convenience entry point.
+        program = compile_template(template).program
+        content = self.execute(program, context)
+        if collect_meta:
+            return RenderResult(
+                content=content,
+                variables=list(program.variables),
+                conditions=list(program.conditions),
+            )
+        return content
 
-            # Track resolution for cycle detection
-            self._resolution_stack.add(section_name)
+    def compile(self, template: str) -> Program:
+        """
+        Tokenize a template in a single pass and build its op tree.
 
-            section = self._sections[section_name]
-            content = section.content
+        One scan with TAG_PATTERN replaces the old section/conditional/
+        include/variable regex passes, and collects the variable and
+        condition lists as a side effect of the same walk.
+        """
+        if not isinstance(template, str):
+            raise InvalidTemplateError(str(template), "Template must be a string")
 
-            # Recursively process includes in the section
-            content = self._process_includes(content, context)
-            content = self._substitute_variables(content, context)
+        # Tag-free templates (plain text, the degenerate common case)
+        # skip the finditer walk and format-string build entirely.
+        if TAG_PATTERN.search(template) is None:
+            return Program(
+                ops=[('lit', template)],
+                sections={},
+                variables=[],
+                conditions=[],
+                simple=True,
+            )
 
-            self._resolution_stack.remove(section_name)
+        root: List[tuple] = []
+        sections: Dict[str, List[tuple]] = {}
+        variables: List[str] = []
+        conditions: List[str] = []
+        # Open block frames: [kind, payload, ops, else_ops, parent_ops, raw_tag]
+        stack: List[list] = []
+        ops = root
+        pos = 0
 
-            return content
+        for match in TAG_PATTERN.finditer(template):
+            if match.start() > pos:
+                ops.append(('lit', template[pos:match.start()]))
+            pos = match.end()
 
-        return self.INCLUDE_PATTERN.sub(include_handler, template)
+            var_name = match.group(1)
+            if var_name:
+                # Interned names make the context dict probes during
+                # render hit CPython's identity-compare fast path.
+                var_name = sys.intern(var_name)
+                variables.append(var_name)
+                ops.append(('var', var_name))
+                continue
+
+            tag, payload = match.group(2), match.group(3)
+
+            if tag == 'if':
+                payload = sys.intern(payload)
+                conditions.append(payload)
+                frame = ['if', payload, [], None, ops, match.group(0)]
+                stack.append(frame)
+                ops = frame[2]
+            elif tag == 'else':
+                if stack and stack[-1][0] == 'if' and stack[-1][3] is None:
+                    stack[-1][3] = []
+                    ops = stack[-1][3]
+                else:
+                    # Stray else: leave it in the output like any other text
+                    ops.append(('lit', match.group(0)))
+            elif tag == 'endif':
+                if stack and stack[-1][0] == 'if':
+                    frame = stack.pop()
+                    ops = frame[4]
+                    then_ops, else_ops = frame[2], frame[3] or []
+                    constant = fold_constant(frame[1])
+                    if constant is not None:
+                        # Literal-only condition: resolve the branch now
+                        # and splice it inline - no if op survives to be
+                        # re-evaluated on every render.
+                        ops.extend(then_ops if constant else else_ops)
+                    else:
+                        inner = strip_outer_not(frame[1])
+                        if inner is not None:
+                            # Whole-condition NOT: test the operand and
+                            # swap branches instead of negating at
+                            # runtime.
+                            ops.append(('if', inner, else_ops, then_ops))
+                        else:
+                            ops.append(('if', frame[1], then_ops, else_ops))
+                else:
+                    ops.append(('lit', match.group(0)))
+            elif tag == 'section':
+                frame = ['section', payload, [], None, ops, match.group(0)]
+                stack.append(frame)
+                ops = frame[2]
+            elif tag == 'endsection':
+                if stack and stack[-1][0] == 'section':
+                    frame = stack.pop()
+                    body = self._strip_ops(frame[2])
+                    if all(op[0] == 'lit' for op in body):
+                        # Static section (boilerplate with no variables,
+                        # conditionals or includes): pre-join once so
+                        # every include emits a single cached string.
+                        body = [('lit', ''.join(op[1] for op in body))]
+                    sections[frame[1]] = body
+                    ops = frame[4]
+                else:
+                    ops.append(('lit', match.group(0)))
+            elif tag == 'include':
+                ops.append(('include', payload))
+
+        if pos < len(template):
+            ops.append(('lit', template[pos:]))
+
+        # Unclosed blocks degrade gracefully: emit the opening tag as
+        # literal text and splice their collected ops back inline.
+        while stack:
+            frame = stack.pop()
+            parent = frame[4]
+            parent.append(('lit', frame[5]))
+            parent.extend(frame[2])
+            if frame[3] is not None:
+                parent.append(('lit', '{% else %}'))
+                parent.extend(frame[3])
+            ops = parent
+
+        # Keyed on the surviving ops, not the collected metadata, so a
+        # template whose only conditions folded away still qualifies.
+        simple = not sections and all(
+            op[0] in ('lit', 'var') for op in root
+        )
+
+        # Variables-only templates additionally translate to a format
+        # string when every name maps unambiguously onto a format field
+        # (dot parts are identifiers, and no literal '__' that would
+        # collide with the dot encoding).
+        format_str = None
+        if simple and all(
+            '__' not in name and all(p.isidentifier() for p in name.split('.'))
+            for name in variables
+        ):
+            format_str = ''.join(
+                op[1].replace('{', '{{').replace('}', '}}')
+                if op[0] == 'lit'
+                else '{' + op[1].replace('.', '__') + '}'
+                for op in root
+            )
 
-    def _substitute_variables(self, template: str, context: Dict[str, Any]) -> str:
+        return Program(
+            ops=root,
+            sections=sections,
+            variables=variables,
+            conditions=conditions,
+            simple=simple,
+            format_str=format_str,
+        )
+
+    @staticmethod
+    def _strip_ops(ops: List[tuple]) -> List[tuple]:
+        """Strip leading/trailing whitespace from a section's op list."""
+        if ops and ops[0][0] == 'lit':
+            stripped = ops[0][1].lstrip()
+            ops[0] = ('lit', stripped)
+            if not stripped:
+                ops = ops[1:]
+        if ops and ops[-1][0] == 'lit':
+            stripped = ops[-1][1].rstrip()
+            ops[-1] = ('lit', stripped)
+            if not stripped:
+                ops = ops[:-1]
+        return ops
+
+    def iter_render(
+        self, template: str, context: Dict[str, Any]
+    ) -> Iterator[str]:
         """
-        Substitute variables with TYPE-SAFE handling.
+        Render a template as a stream of string pieces.
 
-        This method properly handles:
-        - None values -> empty string
-        - Tuples/Lists -> comma-separated string
-        - Nested dict access -> dot notation
-        - Missing variables -> placeholder or error based on config
+        Yields literal chunks and resolved variables as they are
+        produced, so callers (e.g. streaming HTTP responses) never hold
+        the full rendered document in memory. Unlike render(), the
+        output is not stripped of surrounding whitespace.
         """
-        def variable_handler(match):
-            var_name = match.group(1)
-
-            try:
-                value = self.variable_resolver.resolve(var_name, context)
-                return self._to_safe_string(value)
-            except VariableResolutionError:
-                # Return placeholder for missing variables
-                return f"[{var_name}]"
+        if not isinstance(template, str):
+            raise InvalidTemplateError(str(template), "Template must be a string")
 
-        return self.VARIABLE_PATTERN.sub(variable_handler, template)
+        program = compile_template(template).program
+        yield from self._iter_ops(program.ops, program.sections, context, set())
+
+    def _iter_ops(
+        self,
+        ops: List[tuple],
+        sections: Dict[str, List[tuple]],
+        context: Dict[str, Any],
+        active: Set[str],
+    ) -> Iterator[str]:
+        """Generator twin of _execute_ops."""
+        for op in ops:
+            kind = op[0]
+            if kind == 'lit':
+                yield op[1]
+            elif kind == 'var':
+                yield self._render_variable(op[1], context)
+            elif kind == 'if':
+                try:
+                    result = self.condition_evaluator.evaluate(op[1], context)
+                except Exception:
+                    continue
+                yield from self._iter_ops(
+                    op[2] if result else op[3], sections, context, active
+                )
+            elif kind == 'include':
+                name = op[1]
+                if name in active:
+                    chain = list(active) + [name]
+                    raise CircularDependencyError(chain)
+                if name not in sections:
+                    yield f"[MISSING SECTION: {name}]"
+                    continue
+                body = sections[name]
+                if len(body) == 1 and body[0][0] == 'lit':
+                    yield body[0][1]
+                    continue
+                active.add(name)
+                yield from self._iter_ops(body, sections, context, active)
+                active.remove(name)
+
+    def execute(self, program: Program, context: Dict[str, Any]) -> str:
+        """Execute a compiled program against a context."""
+        ops = program.ops
+        if len(ops) == 1 and ops[0][0] == 'lit':
+            # Literal-only program: the render is the text itself.
+            return ops[0][1].strip()
+
+        if program.format_str is not None:
+            # Variables-only template: one C-level substitution pass,
+            # with _CtxMap routing each field through the engine's
+            # resolution and formatting rules.
+            return program.format_str.format_map(_CtxMap(self, context)).strip()
+
+        if program.simple:
+            # Variables-only but not format-expressible (unusual names):
+            # flat literal/variable join, no condition or include work.
+            render_variable = self._render_variable
+            return "".join(
+                op[1] if op[0] == 'lit' else render_variable(op[1], context)
+                for op in program.ops
+            ).strip()
+
+        out: List[str] = []
+        self._execute_ops(program.ops, program.sections, context, out, {}, set())
+        return "".join(out).strip()
+
+    def _execute_ops(
+        self,
+        ops: List[tuple],
+        sections: Dict[str, List[tuple]],
+        context: Dict[str, Any],
+        out: List[str],
+        memo: Dict[str, str],
+        active: Set[str],
+    ) -> None:
+        """Walk an op list once, appending rendered pieces to `out`."""
+        # Bind hot lookups to locals: inside this loop every LOAD_ATTR
+        # saved is paid back once per op per render.
+        append = out.append
+        evaluate = self.condition_evaluator.evaluate
+        render_variable = self._render_variable
+
+        for op in ops:
+            kind = op[0]
+            if kind == 'lit':
+                append(op[1])
+            elif kind == 'var':
+                # Per-render memo: each distinct variable resolves and
+                # formats once per document, however often it appears.
+                name = op[1]
+                piece = memo.get(name)
+                if piece is None:
+                    piece = memo[name] = render_variable(name, context)
+                append(piece)
+            elif kind == 'if':
+                try:
+                    result = evaluate(op[1], context)
+                except Exception:
+                    # Don't crash on bad conditions - render nothing
+                    continue
+                self._execute_ops(
+                    op[2] if result else op[3], sections, context, out, memo, active
+                )
+            elif kind == 'include':
+                name = op[1]
+                if name in active:
+                    chain = list(active) + [name]
+                    raise CircularDependencyError(chain)
+                if name not in sections:
+                    append(f"[MISSING SECTION: {name}]")
+                    continue
+                body = sections[name]
+                if len(body) == 1 and body[0][0] == 'lit':
+                    # Pre-rendered static section: no cycle bookkeeping
+                    # or recursion needed.
+                    append(body[0][1])
+                    continue
+                active.add(name)
+                self._execute_ops(body, sections, context, out, memo, active)
+                active.remove(name)
+
+    def _render_variable(self, var_name: str, context: Dict[str, Any]) -> str:
+        """Resolve and format a single variable, with a placeholder fallback."""
+        value = self.variable_resolver.resolve_or_missing(var_name, context)
+        if value is _MISSING:
+            # Placeholder for missing variables - a sentinel check, not
+            # an exception unwind, since missing is an expected outcome.
+            return _missing_placeholder(var_name)
+        try:
+            return self._to_safe_string(value)
+        except VariableResolutionError:
+            # Unsubstitutable value (e.g. a bare dict)
+            return _missing_placeholder(var_name)
 
     def _to_safe_string(self, value: Any) -> str:
         """
@@ -232,17 +552,19 @@ class TemplateEngine:
         - datetime -> ISO format
         - Any other -> str()
         """
-        if value is None:
-            return ""
-
-        if isinstance(value, str):
-            return value.strip()
+        # Boolean singletons first: two pointer compares, no dict probe.
+        if value is True:
+            return "Yes"
+        if value is False:
+            return "No"
 
-        if isinstance(value, bool):
-            return "Yes" if value else "No"
+        converter = _CONVERTERS.get(type(value))
+        if converter is not None:
+            return converter(value)
 
-        if isinstance(value, (int, float)):
-            return str(value)
+        # Scalar subclasses (not exact types) still format safely
+        if isinstance(value, (str, bool, int, float)):
+            return _safe_str_scalar(value)
 
         if isinstance(value, (list, tuple)):
             # Filter out None values and convert each item safely
@@ -265,16 +587,11 @@ class TemplateEngine:
 
     def get_variables(self, template: str) -> List[str]:
         """Extract all variable names from a template."""
-        return self.VARIABLE_PATTERN.findall(template)
+        return list(self.compile(template).variables)
 
     def get_conditions(self, template: str) -> List[str]:
         """Extract all conditions from a template."""
-        conditions = []
-        for match in self.CONDITIONAL_PATTERN.finditer(template):
-            conditions.append(match.group(1))
-        for match in self.CONDITIONAL_ELSE_PATTERN.finditer(template):
-            conditions.append(match.group(1))
-        return conditions
+        return list(self.compile(template).conditions)
 
     def validate(self, template: str) -> Dict[str, Any]:
         """
@@ -289,14 +606,12 @@ class TemplateEngine:
         sections = []
 
         try:
-            variables = self.get_variables(template)
-        except Exception as e:
-            errors.append(f"Variable parsing error: {e}")
-
-        try:
-            conditions = self.get_conditions(template)
+            program = self.compile(template)
+            variables = list(program.variables)
+            conditions = list(program.conditions)
+            sections = list(program.sections.keys())
         except Exception as e:
-            errors.append(f"Condition parsing error: {e}")
+            errors.append(f"Template parsing error: {e}")
 
         # Check for unclosed tags
         if template.count('{%') != template.count('%}'):
@@ -309,6 +624,62 @@ class TemplateEngine:
             'valid': len(errors) == 0,
             'variables': variables,
             'conditions': conditions,
-            'sections': list(self._sections.keys()),
+            'sections': sections,
             'errors': errors,
         }
+
+
+class CompiledTemplate:
+    """
+    A template parsed once, with precomputed metadata.
+
+    Rendering the same template repeatedly (the common case for stored
+    templates) only pays variable/condition extraction once instead of
+    on every request. Obtain instances via `compile_template()` so hot
+    templates are shared through the module-level cache.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.program = DEFAULT_ENGINE.compile(content)
+        self.variables: List[str] = list(self.program.variables)
+        self.conditions: List[str] = list(self.program.conditions)
+        self._validation: Optional[Dict[str, Any]] = None
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render this template with the given context."""
+        return DEFAULT_ENGINE.execute(self.program, context)
+
+    def validate(self) -> Dict[str, Any]:
+        """Validate this template, caching the analysis."""
+        if self._validation is None:
+            self._validation = DEFAULT_ENGINE.validate(self.content)
+        return self._validation
+
+
+@functools.lru_cache(maxsize=512)
+def compile_template(template_content: str) -> CompiledTemplate:
+    """
+    Compile a template, caching the result by content.
+
+    Keying on the raw content means edits to a stored Template
+    invalidate the cache automatically (new content, new entry).
+    """
+    return CompiledTemplate(template_content)
+
+
+# Shared default engine. TemplateEngine keeps no per-render state (the
+# include stack and variable memo travel as call arguments), so one
+# instance can serve every caller - including concurrent threads -
+# without re-running __init__ per render.
+DEFAULT_ENGINE = TemplateEngine()
+
+
+def render(
+    template: str,
+    context: Dict[str, Any],
+    *,
+    collect_meta: bool = False,
+) -> Union[str, RenderResult]:
+    """Render a template through the shared default engine."""
+    return DEFAULT_ENGINE.render(template, context, collect_meta=collect_meta)
@@ -12,6 +12,10 @@ from typing import Any, Dict, List, Optional
 
 from .exceptions import VariableResolutionError
 
+# Sentinel distinguishing "variable not present" from a present None
+# value, for callers that want to avoid exception-based control flow.
+_MISSING = object()
+
 
 class VariableResolver:
     """
@@ -45,6 +49,13 @@ class VariableResolver:
                    If False, return None for missing variables.
         """
         self.strict = strict
+        # Pre-split dot paths, keyed by variable name. Hot templates
+        # resolve the same handful of names per render, so the split
+        # happens once per name for the resolver's lifetime.
+        self._parts_cache: Dict[str, tuple] = {}
+        # Bind the walk implementation once: the lax walk carries none
+        # of the resolved-path bookkeeping that only error messages use.
+        self._resolve = self._resolve_strict if strict else self._resolve_lax
 
     def resolve(self, name: str, context: Dict[str, Any]) -> Any:
         """
@@ -63,7 +74,14 @@ class VariableResolver:
         if not name:
             raise VariableResolutionError("", "Empty variable name")
 
-        parts = name.split('.')
+        parts = self._parts_cache.get(name)
+        if parts is None:
+            parts = self._parts_cache[name] = tuple(name.split('.'))
+
+        return self._resolve(name, parts, context)
+
+    def _resolve_strict(self, name: str, parts: tuple, context: Dict[str, Any]) -> Any:
+        """Path walk that raises with a located message on any miss."""
         value = context
         resolved_path = []
 
@@ -71,43 +89,108 @@ class VariableResolver:
             resolved_path.append(part)
 
             if value is None:
-                if self.strict:
+                raise VariableResolutionError(
+                    name,
+                    f"Cannot access '{part}' on None value at '{'.'.join(resolved_path[:-1])}'"
+                )
+
+            if isinstance(value, dict):
+                # Single hash probe via sentinel instead of
+                # `part in value` followed by `value[part]`.
+                nxt = value.get(part, _MISSING)
+                if nxt is _MISSING:
                     raise VariableResolutionError(
                         name,
-                        f"Cannot access '{part}' on None value at '{'.'.join(resolved_path[:-1])}'"
+                        f"Key '{part}' not found in dict at '{'.'.join(resolved_path[:-1]) or 'root'}'"
                     )
-                return None
+                value = nxt
 
-            if isinstance(value, dict):
-                if part in value:
-                    value = value[part]
-                elif self.strict:
+            else:
+                attr = getattr(value, part, _MISSING)
+                if attr is _MISSING:
                     raise VariableResolutionError(
                         name,
-                        f"Key '{part}' not found in dict at '{'.'.join(resolved_path[:-1]) or 'root'}'"
+                        f"Attribute '{part}' not found on {type(value).__name__}"
                     )
+                # If it's a method with no required args, call it
+                if callable(attr):
+                    try:
+                        value = attr()
+                    except TypeError:
+                        # Method requires arguments, return the method itself
+                        value = attr
                 else:
+                    value = attr
+
+        return value
+
+    def _resolve_lax(self, name: str, parts: tuple, context: Dict[str, Any]) -> Any:
+        """Path walk with no error bookkeeping; misses resolve to None."""
+        value = context
+
+        for part in parts:
+            if value is None:
+                return None
+
+            if isinstance(value, dict):
+                value = value.get(part, _MISSING)
+                if value is _MISSING:
                     return None
 
-            elif hasattr(value, part):
-                attr = getattr(value, part)
-                # If it's a method with no required args, call it
+            else:
+                attr = getattr(value, part, _MISSING)
+                if attr is _MISSING:
+                    return None
                 if callable(attr):
                     try:
                         value = attr()
                     except TypeError:
-                        # Method requires arguments, return the method itself
                         value = attr
                 else:
                     value = attr
 
-            elif self.strict:
-                raise VariableResolutionError(
-                    name,
-                    f"Attribute '{part}' not found on {type(value).__name__}"
-                )
+        return value
+
+    def resolve_or_missing(self, name: str, context: Dict[str, Any]) -> Any:
+        """
+        Resolve a variable, returning the _MISSING sentinel instead of
+        raising when it cannot be found.
+
+        Mirrors strict-mode resolve() semantics (every case that would
+        raise maps to _MISSING) but costs no exception setup/unwind on
+        the hot render path, where missing variables are an expected
+        outcome rather than an error.
+        """
+        if not name:
+            return _MISSING
+
+        parts = self._parts_cache.get(name)
+        if parts is None:
+            parts = self._parts_cache[name] = tuple(name.split('.'))
+        value = context
+
+        for part in parts:
+            if value is None:
+                return _MISSING
+
+            if isinstance(value, dict):
+                value = value.get(part, _MISSING)
+                if value is _MISSING:
+                    return _MISSING
+
             else:
-                return None
+                attr = getattr(value, part, _MISSING)
+                if attr is _MISSING:
+                    return _MISSING
+                # If it's a method with no required args, call it
+                if callable(attr):
+                    try:
+                        value = attr()
+                    except TypeError:
+                        # Method requires arguments, return the method itself
+                        value = attr
+                else:
+                    value = attr
 
         return value
 
@@ -122,7 +205,8 @@ class VariableResolver:
         Returns:
             Dict mapping variable names to their resolved values
         """
-        return {name: self.resolve(name, context) for name in names}
+        resolve = self.resolve
+        return {name: resolve(name, context) for name in names}
 
     def has_variable(self, name: str, context: Dict[str, Any]) -> bool:
         """Check if a variable exists in the context."""
@@ -136,23 +220,27 @@ class VariableResolver:
         """
         Get all available variable names from a context.
 
-        Recursively explores nested dicts to find all possible variable paths.
+        Explores nested dicts iteratively (explicit stack, no recursion)
+        to find all possible variable paths, so arbitrarily deep
+        contexts cost neither call frames nor a RecursionError.
 
         Args:
             context: Context dictionary
-            prefix: Current path prefix (for recursion)
+            prefix: Starting path prefix
 
         Returns:
             List of all available variable paths
         """
         variables = []
+        stack = [(prefix, context)]
 
-        for key, value in context.items():
-            full_path = f"{prefix}.{key}" if prefix else key
-            variables.append(full_path)
+        while stack:
+            path, current = stack.pop()
+            for key, value in current.items():
+                full_path = f"{path}.{key}" if path else key
+                variables.append(full_path)
 
-            # Recurse into nested dicts
-            if isinstance(value, dict):
-                variables.extend(self.get_available_variables(value, full_path))
+                if isinstance(value, dict):
+                    stack.append((full_path, value))
 
         return variables
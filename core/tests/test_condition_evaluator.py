@@ -3,11 +3,11 @@ Tests for DocuForge Condition Evaluator
 
 Tests the boolean condition evaluation with correct operator precedence.
 """
-from django.test import TestCase
+from django.test import SimpleTestCase
 from core.parser import ConditionEvaluator
 
 
-class TestBasicConditions(TestCase):
+class TestBasicConditions(SimpleTestCase):
     """Tests for basic condition evaluation."""
 
     def setUp(self):
@@ -34,7 +34,7 @@ class TestBasicConditions(TestCase):
         self.assertFalse(result)
 
 
-class TestComparisonOperators(TestCase):
+class TestComparisonOperators(SimpleTestCase):
     """Tests for comparison operators."""
 
     def setUp(self):
@@ -66,7 +66,7 @@ class TestComparisonOperators(TestCase):
         self.assertFalse(self.evaluator.evaluate("x >= 10", {'x': 9}))
 
 
-class TestBooleanOperators(TestCase):
+class TestBooleanOperators(SimpleTestCase):
     """Tests for boolean operators."""
 
     def setUp(self):
@@ -88,7 +88,7 @@ class TestBooleanOperators(TestCase):
         self.assertTrue(self.evaluator.evaluate("NOT a", {'a': False}))
 
 
-class TestOperatorPrecedence(TestCase):
+class TestOperatorPrecedence(SimpleTestCase):
     """Tests for correct AND/OR precedence."""
 
     def setUp(self):
@@ -3,11 +3,11 @@ Tests for DocuForge Template Engine
 
 Tests the custom template syntax and type-safe variable handling.
 """
-from django.test import TestCase
+from django.test import SimpleTestCase
 from core.parser import TemplateEngine
 
 
-class TestVariableSubstitution(TestCase):
+class TestVariableSubstitution(SimpleTestCase):
     """Tests for variable substitution."""
 
     def setUp(self):
@@ -70,7 +70,7 @@ class TestVariableSubstitution(TestCase):
         self.assertEqual(result, "Age: 25, Score: 98.5")
 
 
-class TestConditionals(TestCase):
+class TestConditionals(SimpleTestCase):
     """Tests for conditional blocks."""
 
     def setUp(self):
@@ -119,7 +119,7 @@ class TestConditionals(TestCase):
         self.assertEqual(result, "Access")
 
 
-class TestValidation(TestCase):
+class TestValidation(SimpleTestCase):
     """Tests for template validation."""
 
     def setUp(self):
@@ -1,34 +1,47 @@
 """DocuForge URL Configuration"""
+import hashlib
+import json
+
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
-from django.shortcuts import render
+from django.http import HttpResponse, HttpResponseNotModified
+from django.views.decorators.cache import cache_page
+from django.views.generic import TemplateView
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
+# Landing page: static template, rendered once per cache window instead
+# of per request.
+home = cache_page(3600)(TemplateView.as_view(template_name='index.html'))
 
-def home(request):
-    """Landing page with test UI."""
-    return render(request, 'index.html')
+# The api-info payload is static per deploy: serialize it once at import
+# and derive a stable ETag so repeat clients get a bodyless 304.
+_API_INFO_BODY = json.dumps({
+    'name': 'DocuForge API',
+    'version': '1.0.0',
+    'description': 'Custom Document Generation Engine with Type-Safe Template Processing',
+    'author': 'Ahmed Sallemi | MediaTree',
+    'endpoints': {
+        'api_root': '/api/',
+        'health': '/api/health/',
+        'render': '/api/render/',
+        'validate': '/api/validate/',
+        'test_condition': '/api/test-condition/',
+        'docs': '/docs/',
+        'swagger': '/swagger/',
+    },
+    'github': 'https://github.com/sallemiahmed/docuforge',
+}).encode('utf-8')
+_API_INFO_ETAG = f'"{hashlib.blake2b(_API_INFO_BODY, digest_size=8).hexdigest()}"'
 
 
 def api_info(request):
     """API info endpoint."""
-    return JsonResponse({
-        'name': 'DocuForge API',
-        'version': '1.0.0',
-        'description': 'Custom Document Generation Engine with Type-Safe Template Processing',
-        'author': 'Ahmed Sallemi | MediaTree',
-        'endpoints': {
-            'api_root': '/api/',
-            'health': '/api/health/',
-            'render': '/api/render/',
-            'validate': '/api/validate/',
-            'test_condition': '/api/test-condition/',
-            'docs': '/docs/',
-            'swagger': '/swagger/',
-        },
-        'github': 'https://github.com/sallemiahmed/docuforge',
-    })
+    if request.headers.get('If-None-Match') == _API_INFO_ETAG:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(_API_INFO_BODY, content_type='application/json')
+    response['ETag'] = _API_INFO_ETAG
+    return response
 
 
 urlpatterns = [
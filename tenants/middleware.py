@@ -8,9 +8,44 @@ Example:
     acme.docuforge.com -> request.tenant = Tenant(subdomain='acme')
     jones.docuforge.com -> request.tenant = Tenant(subdomain='jones')
 """
+from django.core.cache import cache
 from django.http import HttpResponseNotFound
 
-from .models import Tenant
+from .models import Tenant, tenant_cache_key
+
+# Subdomains that never map to a tenant; frozenset for O(1) membership.
+_SKIP_SUBDOMAINS = frozenset({'www', 'api', 'admin', 'localhost'})
+
+# Cached marker for "no active tenant with this subdomain" so misses
+# don't re-query the database on every request.
+_TENANT_MISS = '__tenant_miss__'
+_TENANT_CACHE_TTL = 300  # seconds
+
+
+def _get_tenant(subdomain):
+    """
+    Fetch an active tenant by subdomain, via the cache.
+
+    Entries are invalidated on Tenant save/delete (see tenants.models),
+    so the TTL only bounds staleness from out-of-band DB changes.
+    """
+    key = tenant_cache_key(subdomain)
+    cached = cache.get(key)
+    if cached is not None:
+        return None if cached == _TENANT_MISS else cached
+
+    try:
+        # Only the columns the request path reads; the rest of the row
+        # (name, limits, timestamps) loads lazily if ever touched.
+        tenant = Tenant.objects.only('id', 'subdomain', 'is_active').get(
+            subdomain=subdomain, is_active=True
+        )
+    except Tenant.DoesNotExist:
+        cache.set(key, _TENANT_MISS, _TENANT_CACHE_TTL)
+        return None
+
+    cache.set(key, tenant, _TENANT_CACHE_TTL)
+    return tenant
 
 
 class TenantMiddleware:
@@ -27,38 +62,38 @@ class TenantMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        # Extract subdomain from host
-        host = request.get_host().split(':')[0]  # Remove port if present
-        parts = host.split('.')
+        # Extract subdomain from host without allocating a parts list:
+        # slice off the port, then only the first label is needed.
+        host = request.get_host()
+        colon = host.find(':')
+        if colon != -1:
+            host = host[:colon]
 
         # Default: no tenant (main site)
         request.tenant = None
         request.tenant_id = None
 
-        # Check for subdomain (e.g., acme.docuforge.com has 3 parts)
-        if len(parts) >= 3:
-            subdomain = parts[0]
+        # Check for subdomain (e.g., acme.docuforge.com has 2 dots)
+        if host.count('.') >= 2:
+            subdomain = host[:host.find('.')]
 
             # Skip common non-tenant subdomains
-            if subdomain not in ('www', 'api', 'admin', 'localhost'):
-                try:
-                    tenant = Tenant.objects.get(subdomain=subdomain, is_active=True)
+            if subdomain not in _SKIP_SUBDOMAINS:
+                tenant = _get_tenant(subdomain)
+                if tenant is not None:
                     request.tenant = tenant
                     request.tenant_id = tenant.subdomain
-                except Tenant.DoesNotExist:
-                    # For strict multi-tenancy, you could return 404 here
-                    # return HttpResponseNotFound("Tenant not found")
-                    pass
+                # For strict multi-tenancy, you could return 404 here
+                # return HttpResponseNotFound("Tenant not found")
 
         # Also check for tenant in header (useful for API testing)
-        if not request.tenant and 'X-Tenant-ID' in request.headers:
-            tenant_id = request.headers['X-Tenant-ID']
-            try:
-                tenant = Tenant.objects.get(subdomain=tenant_id, is_active=True)
-                request.tenant = tenant
-                request.tenant_id = tenant.subdomain
-            except Tenant.DoesNotExist:
-                pass
+        if request.tenant is None:
+            header_id = request.headers.get('X-Tenant-ID')
+            if header_id:
+                tenant = _get_tenant(header_id)
+                if tenant is not None:
+                    request.tenant = tenant
+                    request.tenant_id = tenant.subdomain
 
         return self.get_response(request)
 
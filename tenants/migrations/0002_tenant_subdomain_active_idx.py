@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(
+                condition=models.Q(('is_active', True)),
+                fields=['subdomain'],
+                name='tenant_subdomain_active_idx',
+            ),
+        ),
+    ]
@@ -3,7 +3,15 @@ DocuForge Tenant Models
 
 Multi-tenant support for SaaS deployment.
 """
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+
+def tenant_cache_key(subdomain):
+    """Cache key for a tenant resolved by subdomain."""
+    return f'tenant:sd:{subdomain}'
 
 
 class Tenant(models.Model):
@@ -27,6 +35,22 @@ class Tenant(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # Partial index matching the middleware's exact predicate:
+            # lookup by subdomain among active tenants only.
+            models.Index(
+                fields=['subdomain'],
+                name='tenant_subdomain_active_idx',
+                condition=models.Q(is_active=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.subdomain})"
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def _invalidate_tenant_cache(sender, instance, **kwargs):
+    """Drop the cached lookup whenever a tenant changes or is removed."""
+    cache.delete(tenant_cache_key(instance.subdomain))
@@ -256,6 +256,20 @@ class TestOperatorPrecedence:
         # (True AND False) OR True = False OR True = True
         assert result is True
 
+    def test_boolean_group_compared_as_bool(self):
+        """
+        A parenthesized boolean group used as a comparison operand is a
+        bool, not the raw value Python's `and`/`or` would yield.
+
+        "(a AND b) == true" with truthy non-bool values compares
+        bool(a and b) == True, not (1 and 2) == True.
+        """
+        result = self.evaluator.evaluate(
+            "(a AND b) == true",
+            {'a': 1, 'b': 2}
+        )
+        assert result is True
+
     def test_complex_precedence_case(self):
         """
         Complex expression with correct precedence.
@@ -362,3 +376,110 @@ class TestErrorHandling:
         """Unbalanced parentheses raise error."""
         with pytest.raises(ConditionEvaluationError):
             self.evaluator.evaluate("(a AND b", {'a': True, 'b': True})
+
+    def test_juxtaposed_atoms_raise_error(self):
+        """An atom followed by a paren group is not a call - it's invalid."""
+        with pytest.raises(ConditionEvaluationError):
+            self.evaluator.evaluate("f (y)", {'f': str, 'y': 1})
+
+    def test_chained_comparison_raises_error(self):
+        """Comparisons take single operands; chains are rejected."""
+        with pytest.raises(ConditionEvaluationError):
+            self.evaluator.evaluate("a == b == c", {'a': 1, 'b': 1, 'c': 1})
+
+    def test_trailing_operator_raises_error(self):
+        """A comparison missing its right operand raises."""
+        with pytest.raises(ConditionEvaluationError):
+            self.evaluator.evaluate("age >=", {'age': 20})
+
+
+class TestShortCircuit:
+    """Tests for lazy (short-circuit) boolean evaluation."""
+
+    def setup_method(self):
+        self.evaluator = ConditionEvaluator()
+
+    def test_or_skips_rhs_when_lhs_true(self):
+        """A true LHS in OR never resolves the right-hand variable."""
+        lookups = []
+
+        class TracingDict(dict):
+            def __contains__(self, key):
+                lookups.append(key)
+                return super().__contains__(key)
+
+        context = TracingDict({'is_admin': True, 'expensive': True})
+        result = self.evaluator.evaluate("is_admin OR expensive", context)
+        assert result is True
+        assert 'expensive' not in lookups
+
+    def test_and_skips_rhs_when_lhs_false(self):
+        """A false LHS in AND never resolves the right-hand variable."""
+        lookups = []
+
+        class TracingDict(dict):
+            def __contains__(self, key):
+                lookups.append(key)
+                return super().__contains__(key)
+
+        context = TracingDict({'is_admin': False, 'expensive': True})
+        result = self.evaluator.evaluate("is_admin AND expensive", context)
+        assert result is False
+        assert 'expensive' not in lookups
+
+
+class TestBatchEvaluation:
+    """Tests for evaluating one condition across many contexts."""
+
+    def setup_method(self):
+        self.evaluator = ConditionEvaluator()
+
+    def test_batch_returns_result_per_context(self):
+        """Each context gets its own boolean, in order."""
+        contexts = [
+            {'age': 25, 'has_consent': True},
+            {'age': 16, 'has_consent': True},
+            {'age': 40, 'has_consent': False},
+        ]
+        results = self.evaluator.evaluate_batch(
+            "age >= 18 AND has_consent", contexts
+        )
+        assert results == [True, False, False]
+
+    def test_batch_empty_condition_is_all_true(self):
+        """Empty conditions are true for every context."""
+        results = self.evaluator.evaluate_batch("", [{}, {'a': 1}])
+        assert results == [True, True]
+
+    def test_batch_empty_contexts(self):
+        """An empty batch returns an empty list."""
+        assert self.evaluator.evaluate_batch("a == 1", []) == []
+
+
+class TestRepeatedVariableMemoization:
+    """Tests that repeated variable atoms resolve at most once."""
+
+    def setup_method(self):
+        self.evaluator = ConditionEvaluator()
+
+    def test_repeated_variable_resolved_once(self):
+        """A variable appearing twice only hits the context once."""
+        lookups = []
+
+        class TracingDict(dict):
+            def __contains__(self, key):
+                lookups.append(key)
+                return super().__contains__(key)
+
+        context = TracingDict({'flag': 2})
+        result = self.evaluator.evaluate("flag == 1 OR flag == 2", context)
+        assert result is True
+        assert lookups.count('flag') == 1
+
+    def test_repeated_variable_result_correct(self):
+        """Memoization does not change evaluation results."""
+        context = {'role': 'admin', 'x': False}
+        result = self.evaluator.evaluate(
+            "role == 'admin' OR (role == 'admin' AND x)", context
+        )
+        assert result is True
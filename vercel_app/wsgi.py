@@ -2,15 +2,29 @@
 Vercel WSGI Handler for DocuForge
 
 This module configures Django for serverless deployment on Vercel.
+
+Django setup is deferred to the first request: cold starts that import
+this module but never serve traffic (health probes, warm-up imports)
+skip settings loading and app-registry population entirely.
 """
 import os
 import sys
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the project root to Python path (idempotent, so warm invocations
+# that re-import don't grow sys.path)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'docuforge.settings')
 
-from django.core.wsgi import get_wsgi_application
+_app = None
+
 
-app = get_wsgi_application()
+def app(environ, start_response):
+    """WSGI callable; builds the Django application on first use."""
+    global _app
+    if _app is None:
+        from django.core.wsgi import get_wsgi_application
+        _app = get_wsgi_application()
+    return _app(environ, start_response)